@@ -0,0 +1,8 @@
+from .sqlite_store import open_store, record_run, prune_runs, query_history
+
+__all__ = [
+    "open_store",
+    "record_run",
+    "prune_runs",
+    "query_history"
+]
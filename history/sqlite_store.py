@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import time
+from typing import Dict, Any, List, Optional
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".kubesleuth", "history.db")
+
+# Columns that history queries may filter and group by
+GROUP_COLUMNS = ["run_id", "cluster", "namespace", "severity", "fault"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cluster TEXT NOT NULL,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    started_at REAL NOT NULL,
+    cluster TEXT NOT NULL,
+    namespace TEXT,
+    severity TEXT NOT NULL,
+    fault TEXT NOT NULL,
+    name TEXT
+);
+-- Per-run rollup of findings so trend queries sum counts instead of scanning findings
+CREATE TABLE IF NOT EXISTS finding_counts (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    started_at REAL NOT NULL,
+    cluster TEXT NOT NULL,
+    namespace TEXT,
+    severity TEXT NOT NULL,
+    fault TEXT NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_findings_run ON findings(run_id);
+DROP INDEX IF EXISTS idx_findings_cluster;
+DROP INDEX IF EXISTS idx_findings_namespace;
+DROP INDEX IF EXISTS idx_findings_severity;
+DROP INDEX IF EXISTS idx_findings_fault;
+CREATE INDEX IF NOT EXISTS idx_finding_counts_run ON finding_counts(run_id);
+CREATE INDEX IF NOT EXISTS idx_finding_counts_cluster ON finding_counts(cluster, started_at);
+CREATE INDEX IF NOT EXISTS idx_finding_counts_namespace ON finding_counts(namespace, started_at);
+CREATE INDEX IF NOT EXISTS idx_finding_counts_severity ON finding_counts(severity, started_at);
+CREATE INDEX IF NOT EXISTS idx_finding_counts_fault ON finding_counts(fault, started_at);
+"""
+
+def open_store(path: Optional[str] = None) -> sqlite3.Connection:
+    path = path or DEFAULT_STORE_PATH
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def record_run(conn: sqlite3.Connection, results: Dict[str, Any], cluster: str, started_at: Optional[float] = None) -> int:
+    started_at = started_at if started_at is not None else time.time()
+    with conn:
+        cursor = conn.execute("INSERT INTO runs (cluster, started_at) VALUES (?, ?)", (cluster, started_at))
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO findings (run_id, started_at, cluster, namespace, severity, fault, name) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (run_id, started_at, cluster, issue.get("namespace"), issue.get("severity"), issue.get("fault"), issue.get("name"))
+                for issue in results.get("issues", [])
+            )
+        )
+        conn.execute(
+            "INSERT INTO finding_counts (run_id, started_at, cluster, namespace, severity, fault, count) "
+            "SELECT run_id, started_at, cluster, namespace, severity, fault, COUNT(*) FROM findings "
+            "WHERE run_id = ? GROUP BY namespace, severity, fault",
+            (run_id,)
+        )
+    return run_id
+
+def prune_runs(conn: sqlite3.Connection, retention_days: int, now: Optional[float] = None) -> int:
+    # Remove runs (and their findings) older than the retention window
+    if retention_days < 1:
+        raise ValueError(f"Retention must be at least 1 day, got {retention_days}")
+    now = now if now is not None else time.time()
+    cutoff = now - retention_days * 86400
+    expired_runs = "SELECT id FROM runs WHERE started_at < ?"
+    with conn:
+        conn.execute(f"DELETE FROM findings WHERE run_id IN ({expired_runs})", (cutoff,))
+        conn.execute(f"DELETE FROM finding_counts WHERE run_id IN ({expired_runs})", (cutoff,))
+        cursor = conn.execute("DELETE FROM runs WHERE started_at < ?", (cutoff,))
+    return cursor.rowcount
+
+def query_history(
+    conn: sqlite3.Connection,
+    group_by: Optional[List[str]] = None,
+    cluster: Optional[str] = None,
+    namespace: Optional[str] = None,
+    severity: Optional[str] = None,
+    fault: Optional[str] = None,
+    since_days: Optional[float] = None,
+    now: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    group_by = group_by or ["severity"]
+    for column in group_by:
+        if column not in GROUP_COLUMNS:
+            raise ValueError(f"Cannot group history by '{column}' (choices: {', '.join(GROUP_COLUMNS)})")
+
+    clauses = []
+    params = []
+    for column, value in (("cluster", cluster), ("namespace", namespace), ("severity", severity), ("fault", fault)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if since_days is not None:
+        now = now if now is not None else time.time()
+        clauses.append("started_at >= ?")
+        params.append(now - since_days * 86400)
+
+    columns = ", ".join(group_by)
+    sql = f"SELECT {columns}, SUM(count) AS count FROM finding_counts"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += f" GROUP BY {columns} ORDER BY {columns}"
+
+    return [dict(row) for row in conn.execute(sql, params)]
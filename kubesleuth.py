@@ -1,5 +1,11 @@
 import argparse
+import json
+import sys
+import yaml
 from outputs import results_to_json, results_to_markdown, results_to_yaml
+from history import open_store, record_run, prune_runs, query_history
+from history.sqlite_store import DEFAULT_STORE_PATH, GROUP_COLUMNS
+from server import AuditCache, serve
 from tasks import *
 
 # Define available checks
@@ -11,9 +17,12 @@ available_checks = {
     'namespace_isolation': check_namespace_isolation,
     'privileged_containers': check_privileged_containers,
     'versions': check_versions,
-    'node_health': check_node_health
+    'node_health': check_node_health,
+    'capacity': check_capacity
 }
 
+levels = ["high", "medium", "low", "all", "debug"]
+
 # Filter issues by severity level
 def filter_issues_by_level(issues, level):
     if level == 'all':
@@ -35,18 +44,98 @@ def audit_kubernetes(kubeconfig=None, context=None, selected_checks=None):
         if check:
             result = check()
             if result:
-                audit_results.update(result)
-                audit_results["issues"].extend(result.get("issues", []))
+                issues = result.get("issues", [])
+                for issue in issues:
+                    issue["check"] = check_name
+                audit_results.update({key: value for key, value in result.items() if key != "issues"})
+                audit_results["issues"].extend(issues)
 
     return audit_results
 
+# Argument type for values that must be at least 1
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+# Render history query rows in the requested output format
+def history_to_output(rows, group_by, output):
+    if output == "json":
+        return json.dumps({"history": rows}, indent=4)
+    elif output == "yaml":
+        return yaml.dump({"history": rows}, default_flow_style=False, sort_keys=False)
+    header = group_by + ["count"]
+    lines = ["## KubeSleuth History", "", "| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    for row in rows:
+        lines.append("| " + " | ".join(str(row[column]) for column in header) + " |")
+    return "\n".join(lines)
+
+# History query subcommand
+def history_main(argv):
+    parser = argparse.ArgumentParser(prog="kubesleuth history", description="Query archived KubeSleuth audit runs")
+    parser.add_argument("--store", help="Path to the history database", default=DEFAULT_STORE_PATH)
+    parser.add_argument("--output", choices=["json", "markdown", "yaml"], default="json", help="Output format (json, markdown, or yaml)")
+    parser.add_argument("--group-by", nargs='+', choices=GROUP_COLUMNS, default=["severity"], help="Columns to count findings by")
+    parser.add_argument("--cluster", help="Only include findings from this cluster", default=None)
+    parser.add_argument("--namespace", help="Only include findings from this namespace", default=None)
+    parser.add_argument("--level", choices=["high", "medium", "low", "info"], default=None, help="Only include findings of this severity")
+    parser.add_argument("--fault", help="Only include findings with this exact fault", default=None)
+    parser.add_argument("--days", type=float, default=90, help="Only include runs from the last N days")
+    args = parser.parse_args(argv)
+
+    conn = open_store(args.store)
+    try:
+        rows = query_history(
+            conn,
+            group_by=args.group_by,
+            cluster=args.cluster,
+            namespace=args.namespace,
+            severity=args.level.capitalize() if args.level else None,
+            fault=args.fault,
+            since_days=args.days
+        )
+    finally:
+        conn.close()
+
+    print(history_to_output(rows, args.group_by, args.output))
+
+# Long-running report server subcommand
+def serve_main(argv):
+    parser = argparse.ArgumentParser(prog="kubesleuth serve", description="Serve KubeSleuth reports over HTTP from a periodically refreshed audit")
+    parser.add_argument("--host", help="Address to listen on", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="Port to listen on", default=8080)
+    parser.add_argument("--interval", type=float, help="Seconds between audit refreshes", default=300)
+    parser.add_argument("--kubeconfig", help="Path to the kubeconfig file", default=None)
+    parser.add_argument("--context", help="Kubernetes context to use", default=None)
+    parser.add_argument(
+        "--checks",
+        nargs='+',
+        choices=list(available_checks.keys()),
+        metavar='CHECK',
+        help="List of checks to run (choices: {})".format(", ".join(available_checks.keys()))
+    )
+    args = parser.parse_args(argv)
+
+    cache = AuditCache(
+        lambda: audit_kubernetes(kubeconfig=args.kubeconfig, context=args.context, selected_checks=args.checks),
+        filter_issues_by_level,
+        interval=args.interval
+    )
+    serve(cache, available_checks, levels, host=args.host, port=args.port)
+
 # Command-line interface
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "history":
+        return history_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        return serve_main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(description="Kubernetes Configuration Audit by KubeSleuth")
     parser.add_argument("--output", choices=["json", "markdown", "yaml"], default="json", help="Output format (json, markdown, or yaml)")
     parser.add_argument("--kubeconfig", help="Path to the kubeconfig file", default=None)
     parser.add_argument("--context", help="Kubernetes context to use", default=None)
-    parser.add_argument("--level", choices=["high", "medium", "low", "all", "debug"], default="all", help="Assessment level to display")
+    parser.add_argument("--level", choices=levels, default="all", help="Assessment level to display")
     parser.add_argument(
         "--checks",
         nargs='+',
@@ -54,9 +143,20 @@ def main():
         metavar='CHECK',
         help="List of checks to run (choices: {})".format(", ".join(available_checks.keys()))
     )
+    parser.add_argument("--store", nargs='?', const=DEFAULT_STORE_PATH, default=None, help="Archive this run to a history database (default path: {})".format(DEFAULT_STORE_PATH))
+    parser.add_argument("--retention-days", type=positive_int, default=90, help="Remove archived runs older than N days when archiving")
     args = parser.parse_args()
 
     audit_results = audit_kubernetes(kubeconfig=args.kubeconfig, context=args.context, selected_checks=args.checks)
+
+    if args.store:
+        conn = open_store(args.store)
+        try:
+            record_run(conn, audit_results, get_cluster_name(args.kubeconfig, args.context))
+            prune_runs(conn, args.retention_days)
+        finally:
+            conn.close()
+
     filtered_issues = filter_issues_by_level(audit_results["issues"], args.level)
     audit_results["issues"] = filtered_issues
 
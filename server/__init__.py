@@ -0,0 +1,6 @@
+from .audit_server import AuditCache, serve
+
+__all__ = [
+    "AuditCache",
+    "serve"
+]
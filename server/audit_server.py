@@ -0,0 +1,152 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable, Optional
+from urllib.parse import urlparse, parse_qs
+from outputs import results_to_json, results_to_markdown, results_to_yaml
+
+RENDERERS = {
+    "json": (results_to_json, "application/json"),
+    "yaml": (results_to_yaml, "application/yaml"),
+    "markdown": (results_to_markdown, "text/markdown; charset=utf-8")
+}
+
+# Rendered reports kept per snapshot; least recently used entries are evicted first
+MAX_RENDERED_REPORTS = 256
+
+# Keeps the latest audit snapshot in memory and caches rendered reports per snapshot
+class AuditCache:
+    def __init__(self, audit: Callable[[], Dict[str, Any]], filter_issues: Callable, interval: float = 300, max_rendered: int = MAX_RENDERED_REPORTS):
+        self.audit = audit
+        self.filter_issues = filter_issues
+        self.interval = interval
+        self.snapshot = None
+        self.generation = 0
+        self.refreshed_at = None
+        self.max_rendered = max_rendered
+        self.rendered = OrderedDict()
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def refresh(self):
+        results = self.audit()
+        with self.lock:
+            self.snapshot = results
+            self.generation += 1
+            self.refreshed_at = time.time()
+            self.rendered = OrderedDict()
+
+    def refresh_forever(self):
+        while not self.stopped.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Exception when refreshing audit snapshot: {e}")
+            self.stopped.wait(self.interval)
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.refresh_forever, name="kubesleuth-refresh", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self.stopped.set()
+
+    # Return (body, etag, content type) for a report, or None if no snapshot is ready yet
+    def report(self, output: str = "json", checks=None, level: str = "all", namespace: Optional[str] = None):
+        key = (output, tuple(sorted(checks)) if checks else None, level, namespace)
+        with self.lock:
+            snapshot = self.snapshot
+            generation = self.generation
+            cached = self.rendered.get(key)
+            if cached:
+                self.rendered.move_to_end(key)
+        if snapshot is None:
+            return None
+        if cached:
+            return cached
+
+        issues = snapshot["issues"]
+        if checks:
+            issues = [issue for issue in issues if issue.get("check") in checks]
+        if namespace:
+            issues = [issue for issue in issues if issue.get("namespace") == namespace]
+        issues = self.filter_issues(issues, level)
+
+        render, content_type = RENDERERS[output]
+        body = render({"issues": issues}).encode("utf-8")
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        entry = (body, etag, content_type)
+        with self.lock:
+            if self.generation == generation:
+                self.rendered[key] = entry
+                while len(self.rendered) > self.max_rendered:
+                    self.rendered.popitem(last=False)
+        return entry
+
+def make_handler(cache: AuditCache, available_checks, levels):
+    class AuditRequestHandler(BaseHTTPRequestHandler):
+        def send_text(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+            body = message.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/healthz":
+                return self.send_text(200, "ok\n")
+            if url.path != "/report":
+                return self.send_text(404, "Not found. Use /report or /healthz.\n")
+
+            query = parse_qs(url.query)
+            output = query.get("format", ["json"])[0]
+            level = query.get("level", ["all"])[0]
+            namespace = query.get("namespace", [None])[0]
+            checks = [check for value in query.get("check", []) for check in value.split(",") if check]
+            if output not in RENDERERS:
+                return self.send_text(400, "Invalid format (choices: {}).\n".format(", ".join(RENDERERS)))
+            if level not in levels:
+                return self.send_text(400, "Invalid level (choices: {}).\n".format(", ".join(levels)))
+            unknown_checks = [check for check in checks if check not in available_checks]
+            if unknown_checks:
+                return self.send_text(400, "Unknown checks: {}.\n".format(", ".join(unknown_checks)))
+
+            report = cache.report(output, checks, level, namespace)
+            if report is None:
+                return self.send_text(503, "Audit snapshot is not ready yet.\n", {"Retry-After": "5"})
+            body, etag, content_type = report
+
+            if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(body)
+
+    return AuditRequestHandler
+
+def serve(cache: AuditCache, available_checks, levels, host: str = "127.0.0.1", port: int = 8080):
+    server = ThreadingHTTPServer((host, port), make_handler(cache, available_checks, levels))
+    cache.start()
+    print(f"KubeSleuth serving reports on http://{host}:{server.server_address[1]}/report (refresh every {cache.interval}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cache.stop()
+        server.server_close()
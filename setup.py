@@ -15,7 +15,8 @@ setup(
         "kubernetes",
         "requests",
         "pyyaml",
-        "jinja2"
+        "jinja2",
+        "numpy"
     ],
     entry_points={
         'console_scripts': [
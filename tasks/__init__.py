@@ -6,7 +6,8 @@ from .check_namespace_isolation import check_namespace_isolation
 from .check_node_health import check_node_health
 from .check_privileged_containers import check_privileged_containers
 from .check_versions import check_versions
-from .utils import append_issue, load_kube_config
+from .check_capacity import check_capacity
+from .utils import append_issue, load_kube_config, get_cluster_name, parse_quantity
 
 __all__ = [
     "check_rbac",
@@ -17,6 +18,9 @@ __all__ = [
     "check_privileged_containers",
     "check_versions",
     "check_node_health",
+    "check_capacity",
     "append_issue",
-    "load_kube_config"
+    "load_kube_config",
+    "get_cluster_name",
+    "parse_quantity"
 ]
@@ -0,0 +1,183 @@
+import json
+import numpy as np
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from typing import Dict, Any, List
+from .utils import append_issue, parse_quantity, load_kube_config
+
+# Node labels used by common providers to identify a node pool, in order of preference
+NODE_POOL_LABELS = [
+    "cloud.google.com/gke-nodepool",
+    "eks.amazonaws.com/nodegroup",
+    "kubernetes.azure.com/agentpool",
+    "node.kubernetes.io/instance-type"
+]
+
+# Share of a pool's free capacity that may sit in fragments too small to fit a typical pod
+FRAGMENTATION_THRESHOLD = 0.5
+
+RESOURCES = [("CPU", 1, "cores"), ("memory", 2 ** 30, "Gi")]
+
+def get_node_pool(labels: Dict[str, str]) -> str:
+    for label in NODE_POOL_LABELS:
+        if label in labels:
+            return labels[label]
+    return "default"
+
+# Load node allocatable values and pod requests/limits from raw API JSON into arrays
+def load_capacity_arrays(nodes: List[Dict[str, Any]], pods: List[Dict[str, Any]]) -> Dict[str, Any]:
+    node_index = {}
+    pool_index = {}
+    node_pool = []
+    node_alloc = []
+    for node in nodes:
+        metadata = node["metadata"]
+        node_index[metadata["name"]] = len(node_index)
+        pool = get_node_pool(metadata.get("labels") or {})
+        node_pool.append(pool_index.setdefault(pool, len(pool_index)))
+        allocatable = (node.get("status") or {}).get("allocatable") or {}
+        node_alloc.append((parse_quantity(allocatable.get("cpu", "0")), parse_quantity(allocatable.get("memory", "0"))))
+
+    pod_names = []
+    pod_namespaces = []
+    pod_node = []
+    container_pod = []
+    quantities = ([], [], [], [])
+    for pod in pods:
+        if (pod.get("status") or {}).get("phase") in ("Succeeded", "Failed"):
+            continue
+        metadata = pod["metadata"]
+        spec = pod["spec"]
+        pod_id = len(pod_names)
+        pod_names.append(metadata["name"])
+        pod_namespaces.append(metadata.get("namespace"))
+        pod_node.append(node_index.get(spec.get("nodeName"), -1))
+        for container in spec["containers"]:
+            resources = container.get("resources") or {}
+            requests = resources.get("requests") or {}
+            limits = resources.get("limits") or {}
+            container_pod.append(pod_id)
+            quantities[0].append(requests.get("cpu"))
+            quantities[1].append(requests.get("memory"))
+            quantities[2].append(limits.get("cpu"))
+            quantities[3].append(limits.get("memory"))
+
+    # Parse each distinct quantity string once, then sum container values per pod
+    parsed = {None: np.nan}
+    for column in quantities:
+        for quantity in set(column):
+            if quantity not in parsed:
+                parsed[quantity] = parse_quantity(quantity)
+    pod_count = len(pod_names)
+    container_pod = np.array(container_pod, dtype=np.int64)
+    totals = []
+    missing = []
+    for column in quantities:
+        values = np.fromiter(map(parsed.__getitem__, column), dtype=np.float64, count=len(column))
+        absent = np.isnan(values)
+        totals.append(np.bincount(container_pod, weights=np.where(absent, 0, values), minlength=pod_count))
+        missing.append(np.bincount(container_pod, weights=absent, minlength=pod_count) > 0)
+
+    return {
+        "node_names": list(node_index),
+        "pool_names": list(pool_index),
+        "node_pool": np.array(node_pool, dtype=np.int64),
+        "node_alloc": np.array(node_alloc, dtype=np.float64).reshape(-1, 2),
+        "pod_names": pod_names,
+        "pod_namespaces": pod_namespaces,
+        "pod_node": np.array(pod_node, dtype=np.int64),
+        "pod_requests": np.column_stack(totals[0:2]),
+        "pod_limits": np.column_stack(totals[2:4]),
+        "pod_missing_requests": missing[0] | missing[1],
+        "pod_missing_limits": missing[2] | missing[3]
+    }
+
+def safe_ratio(numerator, denominator):
+    return np.divide(numerator, denominator, out=np.zeros(np.shape(numerator), dtype=np.float64), where=denominator > 0)
+
+# Compute overcommit, missing requests/limits and fragmentation from capacity arrays
+def analyze_capacity(arrays: Dict[str, Any]) -> List[Dict[str, str]]:
+    issues = []
+    node_names = arrays["node_names"]
+    pool_names = arrays["pool_names"]
+    node_pool = arrays["node_pool"]
+    node_alloc = arrays["node_alloc"]
+    pod_node = arrays["pod_node"]
+    node_count = len(node_names)
+    pool_count = len(pool_names)
+
+    scheduled = pod_node >= 0
+    scheduled_node = pod_node[scheduled]
+    requests = arrays["pod_requests"][scheduled]
+    limits = arrays["pod_limits"][scheduled]
+
+    for column, (label, unit_size, unit) in enumerate(RESOURCES):
+        alloc = node_alloc[:, column]
+        node_requested = np.bincount(scheduled_node, weights=requests[:, column], minlength=node_count)
+        node_limited = np.bincount(scheduled_node, weights=limits[:, column], minlength=node_count)
+        request_ratio = safe_ratio(node_requested, alloc)
+        limit_ratio = safe_ratio(node_limited, alloc)
+
+        # Per-node overcommit
+        for i in np.flatnonzero(request_ratio > 1):
+            append_issue(issues, f"node/{node_names[i]}", "default", f"Node {label} requests are {request_ratio[i]:.0%} of allocatable {label}.", "High")
+        for i in np.flatnonzero(limit_ratio > 1):
+            append_issue(issues, f"node/{node_names[i]}", "default", f"Node {label} limits are overcommitted at {limit_ratio[i]:.0%} of allocatable {label}.", "Low")
+
+        # Per-pool overcommit
+        pool_alloc = np.bincount(node_pool, weights=alloc, minlength=pool_count)
+        pool_requested = np.bincount(node_pool, weights=node_requested, minlength=pool_count)
+        pool_limited = np.bincount(node_pool, weights=node_limited, minlength=pool_count)
+        pool_request_ratio = safe_ratio(pool_requested, pool_alloc)
+        pool_limit_ratio = safe_ratio(pool_limited, pool_alloc)
+        for p in range(pool_count):
+            append_issue(issues, f"nodepool/{pool_names[p]}", "default", f"Node pool {label}: {pool_alloc[p] / unit_size:.1f}{unit} allocatable, {pool_request_ratio[p]:.0%} requested, {pool_limit_ratio[p]:.0%} limited.", "Info")
+        for p in np.flatnonzero(pool_limit_ratio > 1):
+            append_issue(issues, f"nodepool/{pool_names[p]}", "default", f"Node pool {label} limits are overcommitted at {pool_limit_ratio[p]:.0%} of allocatable {label}.", "Medium")
+
+        # Fragmentation: free capacity left in pieces smaller than the median pod request
+        positive_requests = requests[:, column][requests[:, column] > 0]
+        if positive_requests.size == 0:
+            continue
+        median_request = np.median(positive_requests)
+        free = np.maximum(alloc - node_requested, 0)
+        pool_free = np.bincount(node_pool, weights=free, minlength=pool_count)
+        pool_stranded = np.bincount(node_pool, weights=np.where(free < median_request, free, 0), minlength=pool_count)
+        stranded_ratio = safe_ratio(pool_stranded, pool_free)
+        for p in np.flatnonzero(stranded_ratio > FRAGMENTATION_THRESHOLD):
+            append_issue(issues, f"nodepool/{pool_names[p]}", "default", f"Node pool {label} is fragmented: {stranded_ratio[p]:.0%} of free {label} is on nodes that cannot fit a median pod request ({median_request / unit_size:.2f}{unit}).", "Medium")
+
+    # Pods missing requests or limits
+    pod_names = arrays["pod_names"]
+    pod_namespaces = arrays["pod_namespaces"]
+    for i in np.flatnonzero(arrays["pod_missing_requests"]):
+        append_issue(issues, f"pod/{pod_names[i]}", pod_namespaces[i], "Pod has containers missing CPU or memory requests.", "Medium")
+    for i in np.flatnonzero(arrays["pod_missing_limits"]):
+        append_issue(issues, f"pod/{pod_names[i]}", pod_namespaces[i], "Pod has containers missing CPU or memory limits.", "Low")
+
+    return issues
+
+def check_capacity() -> Dict[str, Any]:
+    issues = []
+    core_v1 = client.CoreV1Api()
+
+    try:
+        # Read raw JSON rather than deserializing every pod into API model objects
+        nodes = json.loads(core_v1.list_node(_preload_content=False).data)["items"]
+        pods = json.loads(core_v1.list_pod_for_all_namespaces(
+            field_selector="status.phase!=Succeeded,status.phase!=Failed",
+            _preload_content=False
+        ).data)["items"]
+        issues = analyze_capacity(load_capacity_arrays(nodes, pods))
+        return {"issues": issues}
+    except ApiException as e:
+        print(f"Exception when checking capacity: {e}")
+        return {"issues": issues}
+    finally:
+        core_v1.api_client.close()
+
+# Example usage for debugging
+if __name__ == "__main__":
+    load_kube_config()
+    result = check_capacity()
+    print(result)
@@ -1,7 +1,7 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from typing import Dict, Any, List
-from .utils import append_issue
+from .utils import append_issue, load_kube_config
 
 # Check if the role is a default Kubernetes role
 def is_default_role(role_name: str) -> bool:
@@ -25,7 +25,6 @@ def has_overly_broad_permissions(role) -> bool:
 # Main function to check custom roles
 def check_custom_roles() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
 
     rbac_v1 = client.RbacAuthorizationV1Api()
     try:
@@ -82,5 +81,6 @@ def check_custom_roles() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_custom_roles()
     print(result)
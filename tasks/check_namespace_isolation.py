@@ -1,11 +1,10 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from typing import Dict, Any
-from .utils import append_issue
+from .utils import append_issue, load_kube_config
 
 def check_namespace_isolation() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
     core_v1 = client.CoreV1Api()
     rbac_v1 = client.RbacAuthorizationV1Api()
     networking_v1 = client.NetworkingV1Api()
@@ -85,5 +84,6 @@ def check_namespace_isolation() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_namespace_isolation()
     print(result)
@@ -1,11 +1,10 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from typing import Dict, Any, List
-from .utils import append_issue
+from .utils import append_issue, load_kube_config
 
 def check_network_policies() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
     networking_v1 = client.NetworkingV1Api()
     core_v1 = client.CoreV1Api()
 
@@ -47,5 +46,6 @@ def check_network_policies() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_network_policies()
     print(result)
@@ -1,11 +1,10 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from typing import Dict, Any
-from .utils import append_issue
+from .utils import append_issue, parse_quantity, load_kube_config
 
 def check_node_health() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
     core_v1 = client.CoreV1Api()
 
     try:
@@ -31,9 +30,9 @@ def check_node_health() -> Dict[str, Any]:
 
             # Check node resource allocations
             allocatable = node.status.allocatable or {}
-            if allocatable.get('cpu', '0') < '2':
+            if parse_quantity(allocatable.get('cpu', '0')) < 2:
                 append_issue(issues, f"node/{node_name}", "default", "Node has less than 2 CPUs allocatable.", "Medium")
-            if allocatable.get('memory', '0') < '8Gi':
+            if parse_quantity(allocatable.get('memory', '0')) < parse_quantity('8Gi'):
                 append_issue(issues, f"node/{node_name}", "default", "Node has less than 8Gi of memory allocatable.", "Medium")
 
             # Check node taints
@@ -51,5 +50,6 @@ def check_node_health() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_node_health()
     print(result)
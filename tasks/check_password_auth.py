@@ -1,10 +1,9 @@
-from kubernetes import client, config
+from kubernetes import client
 from typing import Dict, Any
-from .utils import append_issue
+from .utils import append_issue, load_kube_config
 
 def check_password_auth() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
     core_v1 = client.CoreV1Api()
 
     try:
@@ -48,5 +47,6 @@ def check_password_auth() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_password_auth()
     print(result)
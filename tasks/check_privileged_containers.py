@@ -1,11 +1,10 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from typing import Dict, Any, List
-from .utils import append_issue
+from .utils import append_issue, load_kube_config
 
 def check_privileged_containers() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
     core_v1 = client.CoreV1Api()
 
     try:
@@ -57,5 +56,6 @@ def check_privileged_containers() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_privileged_containers()
     print(result)
@@ -1,11 +1,10 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from typing import Dict, Any
-from .utils import append_issue
+from .utils import append_issue, load_kube_config
 
 def check_rbac() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
     rbac_v1 = client.RbacAuthorizationV1Api()
 
     try:
@@ -67,5 +66,6 @@ def check_rbac() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_rbac()
     print(result)
@@ -1,8 +1,8 @@
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from typing import Dict, Any
 import requests
-from .utils import append_issue
+from .utils import append_issue, load_kube_config
 
 def get_latest_version(component: str) -> str:
     # Function to get the latest stable version of the component from an official source
@@ -18,7 +18,6 @@ def get_latest_version(component: str) -> str:
 
 def check_versions() -> Dict[str, Any]:
     issues = []
-    config.load_kube_config()
     core_v1 = client.CoreV1Api()
     version_api = client.VersionApi()
 
@@ -53,5 +52,6 @@ def check_versions() -> Dict[str, Any]:
 
 # Example usage for debugging
 if __name__ == "__main__":
+    load_kube_config()
     result = check_versions()
     print(result)
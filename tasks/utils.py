@@ -1,5 +1,15 @@
+import re
+from functools import lru_cache
 from typing import List, Dict
 
+# Multipliers for Kubernetes resource quantity suffixes
+QUANTITY_SUFFIXES = {
+    "Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "Pi": 2 ** 50, "Ei": 2 ** 60,
+    "n": 1e-9, "u": 1e-6, "m": 1e-3, "": 1,
+    "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18
+}
+QUANTITY_PATTERN = re.compile(r"^([+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)([a-zA-Z]*)$")
+
 def append_issue(issues: List[Dict[str, str]], name: str, namespace: str, fault: str, severity: str):
     issue = {
         "name": name,
@@ -9,6 +19,14 @@ def append_issue(issues: List[Dict[str, str]], name: str, namespace: str, fault:
     }
     issues.append(issue)
 
+# Parse a Kubernetes resource quantity (e.g. '500m', '16', '7Gi') into a float
+@lru_cache(maxsize=4096)
+def parse_quantity(quantity) -> float:
+    match = QUANTITY_PATTERN.match(str(quantity).strip())
+    if not match or match.group(2) not in QUANTITY_SUFFIXES:
+        raise ValueError(f"Invalid Kubernetes quantity: {quantity!r}")
+    return float(match.group(1)) * QUANTITY_SUFFIXES[match.group(2)]
+
 def load_kube_config(kubeconfig=None, context=None):
     from kubernetes import config
     if kubeconfig and context:
@@ -19,3 +37,12 @@ def load_kube_config(kubeconfig=None, context=None):
         config.load_kube_config(context=context)
     else:
         config.load_kube_config()
+
+def get_cluster_name(kubeconfig=None, context=None) -> str:
+    from kubernetes import config
+    contexts, active_context = config.list_kube_config_contexts(config_file=kubeconfig)
+    if context:
+        active_context = next((c for c in contexts if c["name"] == context), active_context)
+    if not active_context:
+        return "unknown"
+    return active_context.get("context", {}).get("cluster") or active_context["name"]
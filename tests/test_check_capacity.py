@@ -0,0 +1,36 @@
+from tasks.check_capacity import analyze_capacity, load_capacity_arrays
+
+def make_node(name, cpu="4", memory="16Gi"):
+    return {"metadata": {"name": name}, "status": {"allocatable": {"cpu": cpu, "memory": memory}}}
+
+def make_pod(name, node_name=None, phase="Running"):
+    resources = {"requests": {"cpu": "500m", "memory": "1Gi"}, "limits": {"cpu": "1", "memory": "2Gi"}}
+    spec = {"containers": [{"name": "app", "resources": resources}]}
+    if node_name:
+        spec["nodeName"] = node_name
+    return {"metadata": {"name": name, "namespace": "apps"}, "spec": spec, "status": {"phase": phase}}
+
+def test_nodes_without_pods():
+    issues = analyze_capacity(load_capacity_arrays([make_node("n1"), make_node("n2")], []))
+    assert [issue["severity"] for issue in issues] == ["Info", "Info"]
+
+def test_only_pending_pods():
+    issues = analyze_capacity(load_capacity_arrays([make_node("n1")], [make_pod("p1")]))
+    assert all(issue["severity"] == "Info" for issue in issues)
+
+def test_only_finished_pods():
+    pods = [make_pod("p1", "n1", "Succeeded"), make_pod("p2", "n1", "Failed")]
+    issues = analyze_capacity(load_capacity_arrays([make_node("n1")], pods))
+    assert all(issue["severity"] == "Info" for issue in issues)
+
+def test_node_request_overcommit():
+    pods = [make_pod(f"p{i}", "n1") for i in range(3)]
+    issues = analyze_capacity(load_capacity_arrays([make_node("n1", cpu="1")], pods))
+    assert {"name": "node/n1", "namespace": "default", "fault": "Node CPU requests are 150% of allocatable CPU.", "severity": "High"} in issues
+
+def test_missing_requests_and_limits():
+    pod = make_pod("p1", "n1")
+    pod["spec"]["containers"].append({"name": "sidecar", "resources": {"requests": {"cpu": "100m"}}})
+    issues = analyze_capacity(load_capacity_arrays([make_node("n1")], [pod]))
+    faults = [(issue["name"], issue["severity"]) for issue in issues if issue["name"].startswith("pod/")]
+    assert faults == [("pod/p1", "Medium"), ("pod/p1", "Low")]